@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Calculate Democratic opportunity scores for SC legislative districts.
+
+Combines election history (elections.json) with candidate filings
+(candidates.json) to produce a 0-100 opportunity score, tier classification,
+and strategic flags for every House and Senate district.
+
+The scoring stage is vectorized: per-district inputs are gathered once into
+Structure-of-Arrays NumPy arrays, then the weighted score, bonuses, and tier
+classification are computed with a handful of array operations instead of a
+Python loop over all 170 districts.
+
+Output: public/data/opportunity.json (and src/data/opportunity.json)
+"""
+
+import json
+import os
+import pickle
+import shutil
+import string
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+PUBLIC_DATA_DIR = PROJECT_ROOT / "public" / "data"
+SRC_DATA_DIR = PROJECT_ROOT / "src" / "data"
+ELECTIONS_FILE = PUBLIC_DATA_DIR / "elections.json"
+CANDIDATES_FILE = PUBLIC_DATA_DIR / "candidates.json"
+PARTY_DATA_FILE = PUBLIC_DATA_DIR / "party-data.json"
+OUTPUT_FILE = PUBLIC_DATA_DIR / "opportunity.json"
+
+# Scoring weights (must sum to 1.0)
+WEIGHT_COMPETITIVENESS = 0.40
+WEIGHT_MARGIN_TREND = 0.25
+WEIGHT_INCUMBENCY = 0.15
+WEIGHT_CANDIDATE = 0.10
+WEIGHT_OPEN_SEAT = 0.10
+
+# The weights never change at runtime, so the scorer is generated once
+# at import with the constants folded into the bytecode as literals
+# (LOAD_CONST instead of five LOAD_GLOBAL lookups per evaluation). The
+# generated function works on scalars and NumPy arrays alike.
+_SCORE_SRC = f"""\
+def _score(comp, trend, incumbency, candidate, open_seat):
+    return ({WEIGHT_COMPETITIVENESS} * comp
+            + {WEIGHT_MARGIN_TREND} * trend
+            + {WEIGHT_INCUMBENCY} * incumbency
+            + {WEIGHT_CANDIDATE} * candidate
+            + {WEIGHT_OPEN_SEAT} * open_seat) * 100.0
+"""
+_score_ns: dict = {}
+exec(_SCORE_SRC, _score_ns)
+_score = _score_ns["_score"]
+
+# Recent general elections considered for trend analysis (newest first)
+RECENT_YEARS = ["2024", "2022", "2020"]
+
+# Margin-trend scaling: a 30-point margin shift saturates the factor
+TREND_SCALE = 60.0
+
+# Tier code -> (label, strategic recommendation)
+TIERS = {
+    "HIGH_OPPORTUNITY": (
+        "High Opportunity",
+        "URGENT: Recruit Democratic candidate immediately",
+    ),
+    "EMERGING": (
+        "Emerging",
+        "Priority candidate recruitment target",
+    ),
+    "BUILD": (
+        "Build",
+        "Long-term investment - party building focus",
+    ),
+    "DEFENSIVE": (
+        "Defensive",
+        "Protect seat - ensure strong candidate and resources",
+    ),
+    "NON_COMPETITIVE": (
+        "Non-Competitive",
+        "Low priority - minimal resources",
+    ),
+}
+
+
+def load_json(path: Path) -> dict:
+    """
+    Load a JSON data file.
+
+    With OPPORTUNITY_CACHE=1 in the environment (local iteration
+    workflow), a pickle sidecar keyed by the source file's mtime is
+    used: if the sidecar is at least as new as the JSON it caches,
+    deserializing it skips re-tokenizing the whole document.
+    """
+    if os.environ.get("OPPORTUNITY_CACHE") != "1":
+        with open(path) as f:
+            return json.load(f)
+
+    sidecar = path.with_name(path.name + ".pkl")
+    if sidecar.exists() and sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        return pickle.loads(sidecar.read_bytes())
+
+    data = json.loads(path.read_bytes())
+    sidecar.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return data
+
+
+def dump_json_bytes(data: dict) -> bytes:
+    """Serialize to pretty-printed JSON bytes, using orjson's C encoder
+    when available and falling back to the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def calculate_margin_trends(margins: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate margin trends for all districts in one vectorized pass.
+
+    Compares the newest available margin to the oldest across recent
+    elections. A positive change means the margin is shrinking (good for
+    the minority party).
+
+    Args:
+        margins: (n_districts, n_years) array ordered newest-first, with
+            NaN marking years a district has no election entry
+
+    Returns:
+        (trend_factor, trend_change) arrays where trend_factor is 0-1
+        (0.5 = neutral) and trend_change is in margin points.
+    """
+    n_districts, n_years = margins.shape
+    valid = ~np.isnan(margins)
+    has_any = valid.any(axis=1)
+
+    # Column index of the newest and oldest year with data per district
+    newest_idx = np.argmax(valid, axis=1)
+    oldest_idx = n_years - 1 - np.argmax(valid[:, ::-1], axis=1)
+
+    rows = np.arange(n_districts)
+    newest = margins[rows, newest_idx]
+    oldest = margins[rows, oldest_idx]
+
+    # Positive = margin shrinking over time
+    trend_change = np.where(has_any, -(newest - oldest), 0.0)
+    trend_factor = np.clip(0.5 + trend_change / TREND_SCALE, 0.0, 1.0)
+
+    return trend_factor, trend_change
+
+
+# Interned comparison constant: equality on interned strings short-
+# circuits on identity
+_DEMOCRATIC = sys.intern("democratic")
+
+
+def cache_lowercase_fields(candidates_data: dict, incumbents_data: dict) -> None:
+    """
+    One-time pass caching lowercased party strings on candidate and
+    incumbent records.
+
+    The per-district predicates are called for all 170 districts; caching
+    the normalized party under a private key means they compare interned
+    strings instead of allocating a fresh .lower() copy on every call.
+    """
+    for chamber in ("house", "senate"):
+        for district in candidates_data.get(chamber, {}).values():
+            for candidate in district.get("candidates", []):
+                candidate["_party_lc"] = sys.intern(
+                    (candidate.get("party") or "").lower()
+                )
+        for incumbent in incumbents_data.get(chamber, {}).values():
+            if incumbent:
+                incumbent["_party_lc"] = sys.intern(
+                    (incumbent.get("party") or "").lower()
+                )
+
+
+# Name-token normalization for incumbent matching
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii"})
+
+
+@lru_cache(maxsize=2048)
+def _normalize(name: str) -> frozenset:
+    """
+    Normalize a name to a token set for matching.
+
+    Lowercases, strips punctuation, and drops generational suffixes and
+    single-letter initials, so "Duncan, Adam L" and "Adam L. Duncan"
+    normalize to the same tokens.
+    """
+    return frozenset(
+        token
+        for token in name.lower().translate(_PUNCT_TABLE).split()
+        if len(token) > 1 and token not in _NAME_SUFFIXES
+    )
+
+
+def has_democratic_candidate(candidates: list) -> bool:
+    """Check whether a Democratic candidate has filed in this district."""
+    for candidate in candidates:
+        if candidate.get("_party_lc") == _DEMOCRATIC:
+            return True
+    return False
+
+
+def is_open_seat(incumbent: dict | None, candidates: list) -> bool:
+    """
+    Check whether this is an open seat (incumbent not running).
+
+    A seat is open if no filed candidate's name shares a normalized name
+    token with the incumbent's name. Token-set comparison handles
+    "Last, First" orderings, middle initials, and suffixes that defeat
+    plain substring matching.
+    """
+    if not incumbent:
+        return True
+
+    incumbent_tokens = _normalize(incumbent.get("name") or "")
+    if not incumbent_tokens:
+        return True
+
+    return not any(
+        incumbent_tokens & _normalize(candidate.get("name") or "")
+        for candidate in candidates
+    )
+
+
+def is_dem_incumbent(incumbent: dict | None) -> bool:
+    """Check whether the district has a Democratic incumbent."""
+    if not incumbent:
+        return False
+    return incumbent.get("_party_lc") == _DEMOCRATIC
+
+
+def score_chamber(elections_chamber: dict, candidates_chamber: dict,
+                  incumbents_chamber: dict) -> dict:
+    """
+    Score every district in a chamber.
+
+    Walks the district data once to build parallel (Structure-of-Arrays)
+    NumPy arrays, computes the weighted scores and tiers with vectorized
+    array expressions, then assembles the output dicts in a final pass.
+
+    Args:
+        elections_chamber: elections.json data for one chamber
+        candidates_chamber: candidates.json data for one chamber
+        incumbents_chamber: party-data.json incumbents for one chamber
+
+    Returns:
+        Dict mapping district number (str) to opportunity data
+    """
+    district_keys = sorted(candidates_chamber, key=int)
+    n = len(district_keys)
+
+    # Single walk over the district data gathering scalar inputs;
+    # per-district margins are packed into a fixed-width row (newest
+    # year first) with NaN marking missing years
+    prepped = []
+    margin_rows = np.full((n, len(RECENT_YEARS)), np.nan)
+    for i, key in enumerate(district_keys):
+        district = candidates_chamber[key]
+        candidates = district.get("candidates", [])
+        incumbent = incumbents_chamber.get(key)
+
+        election_entry = elections_chamber.get(key, {})
+        elections = election_entry.get("elections", {})
+        competitiveness = election_entry.get("competitiveness", {})
+
+        comp_score = competitiveness.get("score", 5)
+        avg_margin = competitiveness.get("avgMargin", 100.0)
+
+        for j, year in enumerate(RECENT_YEARS):
+            if year in elections:
+                margin_rows[i, j] = elections[year].get("margin", 100.0)
+
+        prepped.append((
+            key,
+            comp_score,
+            avg_margin,
+            is_open_seat(incumbent, candidates),
+            has_democratic_candidate(candidates),
+            is_dem_incumbent(incumbent),
+        ))
+
+    # Margin trend for all districts in one pass over the packed rows
+    trend_factor, trend_change = calculate_margin_trends(margin_rows)
+
+    # Structure-of-Arrays: one NumPy array per scoring input
+    comp_score = np.fromiter((p[1] for p in prepped), dtype=np.float64, count=n)
+    open_seat = np.fromiter((p[3] for p in prepped), dtype=bool, count=n)
+    has_dem = np.fromiter((p[4] for p in prepped), dtype=bool, count=n)
+    dem_inc = np.fromiter((p[5] for p in prepped), dtype=bool, count=n)
+
+    comp_factor = comp_score / 100.0
+    incumbency_factor = np.where(open_seat, 1.0, 0.5)
+    candidate_factor = has_dem.astype(np.float64)
+    open_seat_factor = open_seat.astype(np.float64)
+
+    # Vectorized weighted score for all districts at once
+    raw = _score(
+        comp_factor,
+        trend_factor,
+        incumbency_factor,
+        candidate_factor,
+        open_seat_factor,
+    )
+
+    # Bonus for competitive open seats
+    raw += np.where(open_seat & (comp_score > 30), 10.0, 0.0)
+
+    # Districts we hold are never below the defensive floor
+    raw = np.where(dem_inc, np.maximum(raw, 60.0), raw)
+
+    scores = np.clip(np.round(raw), 0, 100).astype(int)
+
+    tiers = np.select(
+        [dem_inc, raw >= 70, raw >= 50, raw >= 30],
+        ["DEFENSIVE", "HIGH_OPPORTUNITY", "EMERGING", "BUILD"],
+        default="NON_COMPETITIVE",
+    )
+
+    # One vectorized rounding pass for the display fields, replacing the
+    # per-district round() calls in the assembly loop
+    comp_factor_out = np.round(comp_factor, 2)
+    trend_factor_out = np.round(trend_factor, 2)
+    trend_change_out = np.round(trend_change, 1)
+
+    # Final assembly pass: materialize JSON dicts
+    results = {}
+    for i, p in enumerate(prepped):
+        key, comp, avg_margin, open_flag, dem_flag, dem_inc_flag = p
+
+        score = int(scores[i])
+        tier = str(tiers[i])
+        label, recommendation = TIERS[tier]
+        t_change = float(trend_change[i])
+
+        # Clamp with int bounds so saturated factors serialize as 0/1,
+        # matching the scalar formula's output
+        t_factor = max(0, min(1, float(trend_factor_out[i])))
+
+        results[key] = {
+            "districtNumber": int(key),
+            "opportunityScore": score,
+            "tier": tier,
+            "tierLabel": label,
+            "factors": {
+                "competitiveness": float(comp_factor_out[i]),
+                "marginTrend": t_factor,
+                "incumbency": 1.0 if open_flag else 0.5,
+                "candidatePresence": 1.0 if dem_flag else 0.0,
+                "openSeatBonus": open_flag,
+            },
+            "metrics": {
+                "avgMargin": avg_margin,
+                "trendChange": float(trend_change_out[i]),
+                "competitivenessScore": comp,
+            },
+            "flags": {
+                "needsCandidate": score >= 50 and not dem_flag,
+                "openSeat": open_flag,
+                "trendingDem": t_change > 2,
+                "defensive": dem_inc_flag,
+                "hasDemocrat": dem_flag,
+            },
+            "recommendation": recommendation,
+        }
+
+    return results
+
+
+def main():
+    print("SC Opportunity Score Calculator")
+    print("=" * 50)
+
+    # Load inputs
+    elections_data = load_json(ELECTIONS_FILE)
+    candidates_data = load_json(CANDIDATES_FILE)
+    party_data = load_json(PARTY_DATA_FILE)
+    incumbents_data = party_data.get("incumbents", {})
+
+    cache_lowercase_fields(candidates_data, incumbents_data)
+
+    output = {
+        "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "house": {},
+        "senate": {},
+    }
+
+    for chamber in ["house", "senate"]:
+        print(f"\nScoring {chamber} districts...")
+
+        results = score_chamber(
+            elections_data.get(chamber, {}),
+            candidates_data.get(chamber, {}),
+            incumbents_data.get(chamber, {}),
+        )
+        output[chamber] = results
+
+        # Tier statistics: one dict lookup per district instead of the
+        # old five-way compare ladder
+        tier_counts = Counter(result["tier"] for result in results.values())
+        needs_candidate = sum(
+            1 for result in results.values() if result["flags"]["needsCandidate"]
+        )
+
+        print(f"  Scored {len(results)} districts")
+        for tier, (label, _) in TIERS.items():
+            print(f"  {label.lower()}: {tier_counts[tier]}")
+        print(f"  needs candidate: {needs_candidate}")
+
+    # Serialize once, write, then copy to the src/data mirror
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_FILE.write_bytes(dump_json_bytes(output))
+    print(f"\nOutput written to: {OUTPUT_FILE}")
+
+    src_output = SRC_DATA_DIR / "opportunity.json"
+    shutil.copyfile(OUTPUT_FILE, src_output)
+    print(f"Also written to: {src_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,19 +8,34 @@ for House and Senate races across 2020, 2022, and 2024 election years.
 Output: public/data/elections.json
 """
 
+import bisect
 import csv
+import io
 import json
 import logging
+import shutil
 import sys
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +68,49 @@ MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
 REQUEST_TIMEOUT_SECONDS = 120
 
+# Pooled HTTP client with keep-alive, so retries and the second chamber
+# download reuse the TLS connection instead of handshaking again. urllib3
+# also takes over retry/backoff handling (including Retry-After on 429).
+# Falls back to the hand-rolled urllib retry loop when unavailable.
+if urllib3 is not None:
+    _HTTP = urllib3.PoolManager(
+        retries=urllib3.util.Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_DELAY_SECONDS,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        ),
+        timeout=urllib3.util.Timeout(connect=10, read=REQUEST_TIMEOUT_SECONDS),
+    )
+else:
+    _HTTP = None
+
+# Competitiveness scoring: average margin at or below each threshold
+# maps to the score at the same index (beyond the last threshold -> 10)
+MARGIN_THRESHOLDS = (5, 10, 15, 20, 30)
+MARGIN_SCORES = (95, 80, 60, 40, 20, 10)
+
+# Metadata rows to skip when processing results
+SKIP_CANDIDATE_NAMES = frozenset({
+    "Write-In", "Total Votes Cast", "Total Ballots Cast", "Overvotes/Undervotes", ""
+})
+
+
+def _parse_votes_slow(value: str) -> int:
+    """Fallback vote parser for signed, comma-grouped, or blank values."""
+    try:
+        return int(value.replace(",", ""))
+    except (ValueError, AttributeError):
+        return 0
+
+
+def dump_json_bytes(data: dict) -> bytes:
+    """Serialize to pretty-printed JSON bytes, using orjson's C encoder
+    when available and falling back to the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
 
 class ElectionHistoryScraper:
     """Scrapes election history data from SC Election Commission API."""
@@ -86,19 +144,30 @@ class ElectionHistoryScraper:
         encoded = urllib.parse.quote(json.dumps(search_params, separators=(",", ":")))
         return f"{BASE_URL}?search={encoded}"
 
-    def download_csv_with_retry(self, url: str) -> list[dict]:
+    def download_csv_with_retry(self, url: str) -> Iterator[dict]:
         """
-        Download and parse CSV from URL with retry logic.
+        Stream and parse CSV rows from URL with retry logic.
+
+        The HTTP response is wrapped in a TextIOWrapper and parsed
+        incrementally, so rows are consumed as they arrive instead of
+        materializing the full body (several MB for the House pull) as a
+        string plus a per-line list. Retries cover connection setup and
+        the header/first-row read; an error after rows have been
+        consumed propagates to the caller.
 
         Args:
             url: The URL to download from
 
-        Returns:
-            List of dictionaries representing CSV rows
+        Yields:
+            The header tuple, then one list per CSV data row
 
         Raises:
             Exception: If all retries fail
         """
+        if _HTTP is not None:
+            yield from self._download_csv_pooled(url)
+            return
+
         last_error = None
 
         for attempt in range(1, MAX_RETRIES + 1):
@@ -107,19 +176,15 @@ class ElectionHistoryScraper:
 
                 req = urllib.request.Request(url, headers=self.session_headers)
 
-                with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
-                    content = response.read().decode("utf-8")
+                response = urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS)
+                text = io.TextIOWrapper(response, encoding="utf-8", newline="")
+                reader = csv.reader(text)
 
-                lines = content.strip().split("\n")
-                if len(lines) < 2:
+                header = tuple(next(reader, []))
+                first_row = next(reader, None)
+                if not header or first_row is None:
                     raise ValueError("CSV response has no data rows")
 
-                reader = csv.DictReader(lines)
-                rows = list(reader)
-
-                logger.info(f"Successfully downloaded {len(rows)} rows")
-                return rows
-
             except urllib.error.HTTPError as e:
                 last_error = e
                 logger.warning(f"HTTP error {e.code}: {e.reason}")
@@ -136,6 +201,15 @@ class ElectionHistoryScraper:
                 last_error = e
                 logger.warning(f"Unexpected error: {e}")
 
+            else:
+                # Connection and header are good - stream the rows
+                with response:
+                    yield header
+                    yield first_row
+                    yield from reader
+                logger.info("Finished streaming CSV response")
+                return
+
             if attempt < MAX_RETRIES:
                 delay = RETRY_DELAY_SECONDS * attempt
                 logger.info(f"Retrying in {delay} seconds...")
@@ -143,96 +217,143 @@ class ElectionHistoryScraper:
 
         raise Exception(f"Failed after {MAX_RETRIES} attempts. Last error: {last_error}")
 
-    def process_results(self, rows: list[dict], chamber: str) -> dict[str, Any]:
+    def _download_csv_pooled(self, url: str) -> Iterator:
+        """Stream CSV rows through the shared urllib3 pool.
+
+        Retries, backoff and Retry-After handling are delegated to the
+        pool's Retry policy, so a terminal error surfaces here as either
+        a raised urllib3 exception or a final bad status.
+        """
+        logger.info("Downloading from API (pooled connection)...")
+        response = _HTTP.request(
+            "GET", url, headers=self.session_headers, preload_content=False
+        )
+        if response.status >= 400:
+            response.release_conn()
+            raise Exception(f"HTTP error {response.status} after {MAX_RETRIES} retries")
+
+        with response:
+            text = io.TextIOWrapper(response, encoding="utf-8", newline="")
+            reader = csv.reader(text)
+
+            header = tuple(next(reader, []))
+            first_row = next(reader, None)
+            if not header or first_row is None:
+                raise ValueError("CSV response has no data rows")
+
+            yield header
+            yield first_row
+            yield from reader
+        logger.info("Finished streaming CSV response")
+
+    def process_results(self, rows: Iterable, chamber: str) -> dict[str, Any]:
         """
         Process CSV rows into election results by district.
 
+        Column indices are resolved once from the header so the hot loop
+        reads fields by position instead of hashing seven key lookups
+        per row (100k+ county-level rows for the House pull).
+
         Args:
-            rows: CSV data rows from the API
+            rows: header tuple followed by CSV data rows (consumed lazily)
             chamber: 'house' or 'senate'
 
         Returns:
             Dict mapping district number (str) to election results
         """
-        # Structure: {district_num: {year: {(candidate_name, party): candidate_data}}}
-        district_data = defaultdict(lambda: defaultdict(dict))
-
-        for row in rows:
-            # Filter to General elections only (skip primaries, runoffs)
-            if row.get("election_type") != "General":
-                continue
-
-            # Filter to County-level data (aggregate, not precinct-level)
-            if row.get("division_type") != "County":
+        row_iter = iter(rows)
+        header = next(row_iter, None)
+        if not header:
+            return {}
+
+        # Resolve column positions once
+        idx = {name: i for i, name in enumerate(header)}
+        col_type = idx["election_type"]
+        col_division = idx["division_type"]
+        col_candidate = idx["candidate_name"]
+        col_date = idx["election_date"]
+        col_district = idx["district_name"]
+        col_party = idx["candidate_party_name"]
+        col_votes = idx["votes"]
+        col_winner = idx["is_winner"]
+
+        # Local bindings: LOAD_FAST beats LOAD_GLOBAL in the row loop
+        _int = int
+        _slow_int = _parse_votes_slow
+
+        # Flat accumulator: one hash per row instead of three nested
+        # dict lookups. Values are [votes, is_winner] lists mutated in
+        # place as county-level rows are summed.
+        acc: dict[tuple, list] = {}
+
+        for row in row_iter:
+            # Cheapest filters first: General elections at County level
+            # (aggregate, not precinct-level) only
+            if row[col_type] != "General" or row[col_division] != "County":
                 continue
 
             # Skip metadata rows
-            candidate_name = row.get("candidate_name", "").strip()
-            if candidate_name in ("Write-In", "Total Votes Cast", "Total Ballots Cast", "Overvotes/Undervotes", ""):
+            candidate_name = row[col_candidate].strip()
+            if candidate_name in SKIP_CANDIDATE_NAMES:
                 continue
 
             # Extract year from election_date (format: YYYY-MM-DD)
-            election_date = row.get("election_date", "")
+            election_date = row[col_date]
             if not election_date:
                 continue
             year = election_date[:4]
 
             # Extract district number
-            district_name = row.get("district_name", "").strip()
+            district_name = row[col_district].strip()
             if not district_name.isdigit():
                 continue
-            district_num = int(district_name)
+            district_num = _int(district_name)
 
-            # Get party and votes
-            party = row.get("candidate_party_name", "").strip()
-            try:
-                votes = int(row.get("votes", 0) or 0)
-            except (ValueError, TypeError):
-                votes = 0
+            # Get party and votes; vote fields are clean digit strings in
+            # the common case, so skip the try/except machinery for them
+            party = row[col_party].strip()
+            v = row[col_votes]
+            votes = _int(v) if v.isdigit() else _slow_int(v)
 
-            is_winner = row.get("is_winner", "").lower() == "true"
+            is_winner = row[col_winner].lower() == "true"
 
             # Accumulate votes for this candidate (data is per-county, need to sum)
-            key = (candidate_name, party)
-            if key not in district_data[district_num][year]:
-                district_data[district_num][year][key] = {
-                    "name": candidate_name,
-                    "party": party,
-                    "votes": 0,
-                    "is_winner": is_winner
-                }
-
-            district_data[district_num][year][key]["votes"] += votes
-
-            # Update is_winner (True if any row says True)
-            if is_winner:
-                district_data[district_num][year][key]["is_winner"] = True
-
-        # Convert to final structure with sorted candidates
+            key = (district_num, year, candidate_name, party)
+            slot = acc.get(key)
+            if slot is None:
+                acc[key] = [votes, is_winner]
+            else:
+                slot[0] += votes
+                # is_winner is True if any county row says True
+                slot[1] |= is_winner
+
+        # Convert to final structure: sort the flat keys once, then
+        # group by district and year to emit the nested shape
         results = {}
+        sorted_items = sorted(acc.items())
 
-        for district_num, years in district_data.items():
+        for district_num, district_group in groupby(sorted_items, key=lambda kv: kv[0][0]):
             district_results = {
                 "districtNumber": district_num,
                 "elections": {}
             }
 
-            for year, candidates in years.items():
-                # Sort candidates by votes (descending)
-                sorted_candidates = sorted(
-                    candidates.values(),
-                    key=lambda x: x["votes"],
-                    reverse=True
-                )
-
-                if not sorted_candidates:
-                    continue
-
-                # Calculate total votes and percentages
-                total_votes = sum(c["votes"] for c in sorted_candidates)
-
-                winner = sorted_candidates[0]
-                runner_up = sorted_candidates[1] if len(sorted_candidates) > 1 else None
+            for year, year_group in groupby(district_group, key=lambda kv: kv[0][1]):
+                # Single pass over the race: accumulate total votes and
+                # track the two highest vote-getters directly, instead of
+                # building and sorting a candidate list just to take top-2
+                total_votes = 0
+                winner = None
+                runner_up = None
+
+                for (_, _, name, party), slot in year_group:
+                    votes = slot[0]
+                    total_votes += votes
+                    if winner is None or votes > winner["votes"]:
+                        runner_up = winner
+                        winner = {"name": name, "party": party, "votes": votes}
+                    elif runner_up is None or votes > runner_up["votes"]:
+                        runner_up = {"name": name, "party": party, "votes": votes}
 
                 winner_pct = round(winner["votes"] / total_votes * 100, 1) if total_votes > 0 else 0
 
@@ -302,6 +423,17 @@ class ElectionHistoryScraper:
         - Whether district has flipped parties
         - Presence of contested races
         """
+        # Districts with no recorded elections (safe seats with no race in
+        # the window) all share the baseline result; skip the aggregation.
+        if not elections:
+            return {
+                "score": 5,
+                "avgMargin": 100.0,
+                "hasSwung": False,
+                "contestedRaces": 0,
+                "dominantParty": None
+            }
+
         margins = []
         parties_won = set()
         contested_count = 0
@@ -327,19 +459,9 @@ class ElectionHistoryScraper:
         # Has the district swung between parties?
         has_swung = len(parties_won) > 1
 
-        # Calculate competitiveness score (100 = most competitive)
-        if avg_margin <= 5:
-            base_score = 95
-        elif avg_margin <= 10:
-            base_score = 80
-        elif avg_margin <= 15:
-            base_score = 60
-        elif avg_margin <= 20:
-            base_score = 40
-        elif avg_margin <= 30:
-            base_score = 20
-        else:
-            base_score = 10
+        # Calculate competitiveness score (100 = most competitive);
+        # one binary search replaces the six-branch compare ladder
+        base_score = MARGIN_SCORES[bisect.bisect_left(MARGIN_THRESHOLDS, avg_margin)]
 
         # Bonus for swing districts
         if has_swung:
@@ -359,42 +481,53 @@ class ElectionHistoryScraper:
             "dominantParty": list(parties_won)[0] if len(parties_won) == 1 else None
         }
 
+    def _fetch_chamber(self, chamber: str, office_id: int) -> dict[str, Any]:
+        """Build the search URL, stream the CSV, and process one chamber."""
+        logger.info(f"Fetching {chamber.upper()} election results...")
+
+        url = self.build_search_url(
+            office_id=office_id,
+            from_year=min(ELECTION_YEARS),
+            to_year=max(ELECTION_YEARS)
+        )
+
+        rows = self.download_csv_with_retry(url)
+        results = self.process_results(rows, chamber)
+
+        logger.info(f"  Processed {len(results)} {chamber} districts")
+        return results
+
     def fetch_all(self) -> dict[str, Any]:
         """
         Fetch election data for all chambers and years.
 
+        The chamber downloads are independent, so they run concurrently
+        and wall time is max(house, senate) instead of their sum.
+
         Returns:
             Complete elections data structure
         """
         output = {
-            "lastUpdated": datetime.now(timezone.utc).isoformat() + "Z",
+            "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "source": "SC Election Commission - electionhistory.scvotes.gov",
             "years": ELECTION_YEARS,
             "house": {},
             "senate": {}
         }
 
-        for chamber, office_id in OFFICE_IDS.items():
-            logger.info(f"Fetching {chamber.upper()} election results...")
-
-            url = self.build_search_url(
-                office_id=office_id,
-                from_year=min(ELECTION_YEARS),
-                to_year=max(ELECTION_YEARS)
-            )
-
-            try:
-                rows = self.download_csv_with_retry(url)
-                logger.info(f"  Downloaded {len(rows)} rows for {chamber}")
-
-                results = self.process_results(rows, chamber)
-                output[chamber] = results
-
-                logger.info(f"  Processed {len(results)} {chamber} districts")
+        with ThreadPoolExecutor(max_workers=len(OFFICE_IDS)) as executor:
+            futures = {
+                executor.submit(self._fetch_chamber, chamber, office_id): chamber
+                for chamber, office_id in OFFICE_IDS.items()
+            }
 
-            except Exception as e:
-                logger.error(f"Failed to fetch {chamber} data: {e}")
-                raise
+            for future in as_completed(futures):
+                chamber = futures[future]
+                try:
+                    output[chamber] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {chamber} data: {e}")
+                    raise
 
         return output
 
@@ -450,16 +583,14 @@ def main() -> int:
         # Ensure output directory exists
         OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to public/data/elections.json
-        with open(OUTPUT_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serialize once, write to public/data/elections.json
+        OUTPUT_FILE.write_bytes(dump_json_bytes(data))
         logger.info(f"\nOutput written to: {OUTPUT_FILE}")
 
-        # Also write to src/data/elections.json for consistency
+        # Also copy to src/data/elections.json for consistency
         SRC_DATA_DIR.mkdir(parents=True, exist_ok=True)
         src_output = SRC_DATA_DIR / "elections.json"
-        with open(src_output, "w") as f:
-            json.dump(data, f, indent=2)
+        shutil.copyfile(OUTPUT_FILE, src_output)
         logger.info(f"Also written to: {src_output}")
 
         # Print summary
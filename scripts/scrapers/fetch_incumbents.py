@@ -8,20 +8,40 @@ and https://www.scstatehouse.gov/member.php?chamber=S for Senate members.
 Output: public/data/incumbents.json
 """
 
+import gzip
 import json
 import logging
+import os
+import random
 import re
 import sys
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,152 +57,94 @@ PUBLIC_DATA_DIR = PROJECT_ROOT / "public" / "data"
 SRC_DATA_DIR = PROJECT_ROOT / "src" / "data"
 OUTPUT_FILE = PUBLIC_DATA_DIR / "incumbents.json"
 
+# Sidecar cache of validator headers and page bodies, so unchanged pages
+# answer with 304 Not Modified and skip the download and parse entirely
+CACHE_FILE = PUBLIC_DATA_DIR / "incumbents.cache.json"
+
 # SC State House URLs
 HOUSE_MEMBERS_URL = "https://www.scstatehouse.gov/member.php?chamber=H"
 SENATE_MEMBERS_URL = "https://www.scstatehouse.gov/member.php?chamber=S"
 
+# Member-page pattern, compiled once at import. A single tolerant pass
+# matches each block regardless of intervening whitespace or markup:
+# <div class="district"><h1><a href="...">District XX</a></h1></div>
+# ... <a class="membername" href="...">Representative Name</a> ... (D)
+_MEMBER_RE = re.compile(
+    r'<div\s+class="district">\s*<h1>\s*<a\s+href="/member\.php\?code=(\d+)">'
+    r'District\s+(\d+)</a>'
+    r'.*?'
+    r'<a\s+class="membername"\s+href="/member\.php\?code=\1">'
+    r'(?:Representative|Senator)\s+([^<]+)</a>'
+    r'(?:&nbsp;|\s)*\(([RD])\)',
+    re.IGNORECASE | re.DOTALL
+)
+_PARTY_ABBR_RE = re.compile(r'\(([RD])\)', re.IGNORECASE)
+
+# Content-Type charset extraction
+_CHARSET_RE = re.compile(r"charset=([^\s;]+)")
+
+# Party-abbreviation expansion and member detail URL prefix
+_PARTY = {"R": "Republican", "D": "Democratic"}
+_URL_PREFIX = "https://www.scstatehouse.gov/member.php?code="
+
 # Request configuration
 REQUEST_TIMEOUT_SECONDS = 60
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
 
+# Concurrency cap for bulk page fetches so scstatehouse.gov is not
+# hammered when many member detail pages are pulled at once
+MAX_CONCURRENT_FETCHES = 20
+
+# Pooled HTTP client with keep-alive so the House and Senate page GETs
+# (and any retries) reuse one TLS connection instead of handshaking per
+# request. Retry pacing stays with the scraper's own loop. Falls back
+# to per-call urllib when urllib3 is unavailable.
+if urllib3 is not None:
+    _HTTP = urllib3.PoolManager(
+        retries=False,
+        timeout=urllib3.util.Timeout(connect=10, read=REQUEST_TIMEOUT_SECONDS),
+    )
+else:
+    _HTTP = None
+
+
+def dump_json_bytes(data: dict) -> bytes:
+    """Serialize to pretty-printed JSON bytes, using orjson's C encoder
+    when available and falling back to the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
 
-@dataclass
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write payload to a temp sibling and rename it into place, so a
+    crash mid-write never leaves a torn file at the destination."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+@dataclass(slots=True, frozen=True)
 class Incumbent:
     """Represents an incumbent legislator."""
     name: str
     party: str
     district: int
+    code: str | None = None
     url: str | None = None
     photo_url: str | None = None
     email: str | None = None
 
-
-class MemberTableParser(HTMLParser):
-    """
-    HTML parser to extract member data from SC State House member tables.
-
-    The website uses a table-based layout with member cards containing:
-    - Photo link
-    - Name (linked to member detail page)
-    - Party in parentheses
-    - District number
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.members: list[dict] = []
-        self.current_member: dict = {}
-        self.in_member_row = False
-        self.in_member_link = False
-        self.in_district_cell = False
-        self.capture_text = False
-        self.current_text = ""
-
-        # Track table structure
-        self.in_table = False
-        self.in_td = False
-        self.td_count = 0
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
-        attrs_dict = dict(attrs)
-
-        if tag == "table":
-            self.in_table = True
-
-        elif tag == "tr" and self.in_table:
-            self.in_member_row = True
-            self.current_member = {}
-            self.td_count = 0
-
-        elif tag == "td" and self.in_member_row:
-            self.in_td = True
-            self.td_count += 1
-
-        elif tag == "a" and self.in_td:
-            href = attrs_dict.get("href", "")
-
-            # Member detail page link
-            if "member.php?code=" in href:
-                self.in_member_link = True
-                self.capture_text = True
-                self.current_text = ""
-
-                # Build full URL
-                if not href.startswith("http"):
-                    href = f"https://www.scstatehouse.gov/{href}"
-                self.current_member["url"] = href
-
-            # Photo image link
-            elif "/images/members/" in href or "/member.php" in href:
-                img_src = attrs_dict.get("src", "")
-                if img_src:
-                    self.current_member["photo_url"] = img_src
-
-        elif tag == "img" and self.in_td:
-            src = attrs_dict.get("src", "")
-            if "/images/members/" in src:
-                if not src.startswith("http"):
-                    src = f"https://www.scstatehouse.gov{src}"
-                self.current_member["photo_url"] = src
-
-    def handle_endtag(self, tag: str):
-        if tag == "table":
-            self.in_table = False
-
-        elif tag == "tr" and self.in_member_row:
-            # End of member row - save if we have data
-            if self.current_member.get("name"):
-                self.members.append(self.current_member.copy())
-            self.in_member_row = False
-            self.current_member = {}
-
-        elif tag == "td":
-            self.in_td = False
-
-        elif tag == "a" and self.in_member_link:
-            self.in_member_link = False
-            self.capture_text = False
-
-            # Parse the captured text for name and party
-            text = self.current_text.strip()
-            if text:
-                self._parse_member_name(text)
-
-    def handle_data(self, data: str):
-        if self.capture_text:
-            self.current_text += data
-
-        elif self.in_td and self.in_member_row:
-            # Look for district number pattern
-            text = data.strip()
-
-            # Match "District X" or just a number
-            district_match = re.search(r"(?:District\s*)?(\d+)", text, re.IGNORECASE)
-            if district_match and "district" not in self.current_member:
-                try:
-                    district = int(district_match.group(1))
-                    if 1 <= district <= 124:  # Valid House district range
-                        self.current_member["district"] = district
-                except ValueError:
-                    pass
-
-    def _parse_member_name(self, text: str):
-        """
-        Parse member name and party from text like:
-        "John Smith (R)" or "Jane Doe (D)"
-        """
-        # Match pattern: Name (Party)
-        match = re.match(r"(.+?)\s*\(([RD])\)\s*$", text)
-        if match:
-            name = match.group(1).strip()
-            party_abbr = match.group(2)
-
-            self.current_member["name"] = name
-            self.current_member["party"] = "Republican" if party_abbr == "R" else "Democratic"
-        else:
-            # No party in parentheses, just use the name
-            self.current_member["name"] = text.strip()
+    def to_dict(self) -> dict:
+        """JSON-ready record matching the incumbents.json schema."""
+        return {
+            "name": self.name,
+            "party": self.party,
+            "code": self.code,
+            "url": self.url,
+            "photo_url": self.photo_url,
+        }
 
 
 class IncumbentsScraper:
@@ -192,13 +154,117 @@ class IncumbentsScraper:
         self.session_headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 SC-Election-Map/2.0",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
             "Accept-Language": "en-US,en;q=0.9",
         }
+        self._page_cache = self._load_cache()
+        # Party tallies per chamber, accumulated while parsing so the
+        # summary never needs a second pass over the members
+        self.party_counts: dict[str, Counter] = {}
+
+    def _load_cache(self) -> dict:
+        """Load the validator/body cache written by a previous run."""
+        try:
+            with open(CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        """Persist validator headers and page bodies for the next run."""
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(CACHE_FILE, "w") as f:
+                json.dump(self._page_cache, f)
+        except OSError as e:
+            logger.warning(f"Could not write page cache: {e}")
+
+    def _conditional_headers(self, url: str) -> dict:
+        """Request headers including validators for a cached copy, if any."""
+        headers = dict(self.session_headers)
+        cached = self._page_cache.get(url)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def _fetch_once(self, url: str) -> str:
+        """Perform a single conditional GET, pooled when available.
+
+        A 304 Not Modified answer short-circuits to the cached body from
+        the previous run; a 200 refreshes the cache entry.
+        """
+        headers = self._conditional_headers(url)
+        cached = self._page_cache.get(url)
+
+        if _HTTP is not None:
+            response = _HTTP.request("GET", url, headers=headers)
+            if response.status == 304 and cached:
+                logger.info(f"Not modified, reusing cached copy: {url}")
+                return cached["html"]
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    url, response.status, response.reason, response.headers, None
+                )
+            resp_headers = response.headers
+            body = response.data
+        else:
+            req = urllib.request.Request(url, headers=headers)
+            try:
+                with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+                    resp_headers = response.headers
+                    body = response.read()
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and cached:
+                    logger.info(f"Not modified, reusing cached copy: {url}")
+                    return cached["html"]
+                raise
+
+            # urllib does not decompress; undo the negotiated encoding
+            # (the urllib3 path above decodes transparently)
+            content_encoding = (resp_headers.get("Content-Encoding") or "").lower()
+            if content_encoding == "gzip":
+                body = gzip.decompress(body)
+            elif content_encoding == "deflate":
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Some servers send raw deflate without the zlib header
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+
+        # Handle potential encoding issues; pages are UTF-8 in practice,
+        # so only parse the header when it actually declares a charset.
+        # urllib's email.message headers parse it natively (and handle
+        # quoted values); the urllib3 header dict falls back to the regex.
+        if hasattr(resp_headers, "get_content_charset"):
+            encoding = resp_headers.get_content_charset("utf-8")
+        else:
+            content_type = resp_headers.get("Content-Type", "")
+            encoding = "utf-8"
+            if "charset=" in content_type:
+                charset_match = _CHARSET_RE.search(content_type)
+                if charset_match:
+                    encoding = charset_match.group(1)
+
+        content = body.decode(encoding, errors="replace")
+        self._page_cache[url] = {
+            "etag": resp_headers.get("ETag"),
+            "last_modified": resp_headers.get("Last-Modified"),
+            "html": content,
+        }
+        return content
 
     def fetch_page_with_retry(self, url: str) -> str:
         """
         Fetch HTML page with retry logic.
 
+        Retries use capped exponential backoff with jitter. Client
+        errors that can never succeed on retry (4xx other than 408/429)
+        fail immediately, and a Retry-After header overrides the
+        computed delay when the server provides one.
+
         Args:
             url: URL to fetch
 
@@ -211,28 +277,23 @@ class IncumbentsScraper:
         last_error = None
 
         for attempt in range(1, MAX_RETRIES + 1):
+            retry_after = None
+
             try:
                 logger.info(f"Attempt {attempt}/{MAX_RETRIES}: Fetching {url}")
 
-                req = urllib.request.Request(url, headers=self.session_headers)
-
-                with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
-                    # Handle potential encoding issues
-                    content_type = response.headers.get("Content-Type", "")
-                    encoding = "utf-8"
-
-                    if "charset=" in content_type:
-                        charset_match = re.search(r"charset=([^\s;]+)", content_type)
-                        if charset_match:
-                            encoding = charset_match.group(1)
-
-                    content = response.read().decode(encoding, errors="replace")
+                content = self._fetch_once(url)
 
                 logger.info(f"Successfully fetched {len(content)} bytes")
                 return content
 
             except urllib.error.HTTPError as e:
+                # Permanent client errors will not improve with retries
+                if 400 <= e.code < 500 and e.code not in (408, 429):
+                    raise
                 last_error = e
+                if e.headers is not None:
+                    retry_after = e.headers.get("Retry-After")
                 logger.warning(f"HTTP error {e.code}: {e.reason}")
 
             except urllib.error.URLError as e:
@@ -248,15 +309,58 @@ class IncumbentsScraper:
                 logger.warning(f"Unexpected error: {e}")
 
             if attempt < MAX_RETRIES:
-                delay = RETRY_DELAY_SECONDS * attempt
-                logger.info(f"Retrying in {delay} seconds...")
+                delay = min(30, RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+                delay += random.uniform(0, 0.5)
+                if retry_after is not None:
+                    try:
+                        delay = float(retry_after)
+                    except ValueError:
+                        pass
+                logger.info(f"Retrying in {delay:.1f} seconds...")
                 time.sleep(delay)
 
         raise Exception(f"Failed after {MAX_RETRIES} attempts. Last error: {last_error}")
 
-    def parse_members_page(self, html: str, chamber: str) -> list[dict]:
+    def fetch_member_pages(self, urls: list[str]) -> dict[str, str | Exception]:
         """
-        Parse members page HTML using regex patterns.
+        Fetch many member detail pages concurrently.
+
+        Groundwork for per-member detail scraping (photo URL, email on
+        Incumbent): sequential fetches across ~170 member pages would
+        dominate runtime. Workers share the pooled keep-alive client and
+        are capped at MAX_CONCURRENT_FETCHES; a failed page is recorded
+        as its exception instead of aborting the whole batch.
+
+        Args:
+            urls: member detail page URLs
+
+        Returns:
+            Dict mapping each URL to its HTML, or to the raised exception
+        """
+        results: dict[str, str | Exception] = {}
+        if not urls:
+            return results
+
+        max_workers = min(MAX_CONCURRENT_FETCHES, len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_page_with_retry, url): url
+                for url in urls
+            }
+
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {url}: {e}")
+                    results[url] = e
+
+        return results
+
+    def parse_members(self, html: str, chamber: str) -> tuple[dict[str, "Incumbent"], Counter]:
+        """
+        Parse members page HTML in a single pass.
 
         The SC State House website structure (as of 2026):
         - Members are in div.memberOutline containers
@@ -264,118 +368,99 @@ class IncumbentsScraper:
         - a.membername contains "Representative/Senator Name"
         - Party (D) or (R) appears right after the membername link
 
+        One tolerant pattern covers the variations the old primary and
+        alternate parsers split between them, so the page is only ever
+        scanned once. Members are materialized as slotted Incumbent
+        records, and party tallies accumulate during the same pass.
+
         Args:
             html: HTML content of the members page
             chamber: 'house' or 'senate'
 
         Returns:
-            List of member dictionaries
+            (district number (str) -> Incumbent, party name -> count)
         """
-        members = []
-
-        # Pattern to match the entire member block structure:
-        # <div class="district"><h1><a href="...">District XX</a></h1></div>
-        # ... <a class="membername" href="...">Representative Name</a>(D)
-        member_block_pattern = re.compile(
-            r'<div\s+class="district">\s*<h1>\s*<a\s+href="/member\.php\?code=(\d+)">'
-            r'District\s+(\d+)</a>\s*</h1>\s*</div>'
-            r'.*?'
-            r'<a\s+class="membername"\s+href="/member\.php\?code=\1">'
-            r'(?:Representative|Senator)\s+([^<]+)</a>\s*'
-            r'\(([RD])\)',
-            re.IGNORECASE | re.DOTALL
-        )
-
-        for match in member_block_pattern.finditer(html):
+        if _SelectolaxParser is not None:
+            return self._parse_members_selectolax(html, chamber)
+
+        members: dict[str, Incumbent] = {}
+        counts: Counter = Counter()
+        max_district = 124 if chamber == "house" else 46
+
+        for match in _MEMBER_RE.finditer(html):
             member_code = match.group(1)
             district = int(match.group(2))
             name = match.group(3).strip()
             party_abbr = match.group(4).upper()
 
-            max_district = 124 if chamber == "house" else 46
             if 1 <= district <= max_district:
-                members.append({
-                    "name": name,
-                    "party": "Republican" if party_abbr == "R" else "Democratic",
-                    "district": district,
-                    "code": member_code,
-                    "url": f"https://www.scstatehouse.gov/member.php?code={member_code}"
-                })
-
-        return members
-
-    def parse_members_alternate(self, html: str, chamber: str) -> list[dict]:
+                party = _PARTY[party_abbr]
+                members[str(district)] = Incumbent(
+                    name=name,
+                    party=party,
+                    district=district,
+                    code=member_code,
+                    url=_URL_PREFIX + member_code,
+                )
+                counts[party] += 1
+
+        return members, counts
+
+    def _parse_members_selectolax(self, html: str, chamber: str) -> tuple[dict[str, "Incumbent"], Counter]:
         """
-        Alternative parsing method - simpler two-step pattern matching.
+        Parse members page with selectolax's C HTML parser.
 
-        Used as fallback if the primary method returns too few results.
-        Extracts memberOutline blocks and parses each one individually.
+        Walks div.memberOutline blocks via CSS selectors, which tokenizes
+        the page in a C extension instead of running Python regexes over
+        the raw markup. Output matches parse_members.
         """
-        members = []
-
-        # Split by memberOutline divs to get individual member blocks
-        # Pattern: <div class="memberOutline">...</div>
-        block_pattern = re.compile(
-            r'<div\s+class="memberOutline">(.*?)</div>\s*(?=<div\s+class="memberOutline">|$)',
-            re.IGNORECASE | re.DOTALL
-        )
-
-        for block_match in block_pattern.finditer(html):
-            block_html = block_match.group(1)
-
-            # Extract district number
-            district_match = re.search(
-                r'<div\s+class="district">\s*<h1>\s*<a[^>]+>District\s+(\d+)</a>',
-                block_html,
-                re.IGNORECASE
-            )
-            if not district_match:
+        members: dict[str, Incumbent] = {}
+        counts: Counter = Counter()
+        max_district = 124 if chamber == "house" else 46
+
+        tree = _SelectolaxParser(html)
+        for node in tree.css("div.memberOutline"):
+            district_node = node.css_first("div.district h1 a")
+            name_node = node.css_first("a.membername")
+            if district_node is None or name_node is None:
                 continue
 
+            # "District XX" -> XX
             try:
-                district = int(district_match.group(1))
-            except ValueError:
+                district = int(district_node.text().split()[-1])
+            except (ValueError, IndexError):
                 continue
-
-            max_district = 124 if chamber == "house" else 46
             if not (1 <= district <= max_district):
                 continue
 
-            # Extract member name and code
-            name_match = re.search(
-                r'<a\s+class="membername"\s+href="/member\.php\?code=(\d+)">'
-                r'(?:Representative|Senator)\s+([^<]+)</a>',
-                block_html,
-                re.IGNORECASE
-            )
-            if not name_match:
+            # /member.php?code=NNNN -> NNNN
+            href = name_node.attributes.get("href") or ""
+            member_code = href.rpartition("code=")[2]
+            if not member_code.isdigit():
                 continue
 
-            member_code = name_match.group(1)
-            name = name_match.group(2).strip()
+            # Drop the "Representative"/"Senator" title prefix
+            name = name_node.text().split(None, 1)[-1].strip()
 
-            # Extract party - appears right after the membername close tag
-            party_match = re.search(
-                r'</a>\s*\(([RD])\)',
-                block_html[name_match.start():],
-                re.IGNORECASE
-            )
+            # Party marker (R)/(D) follows the name link within the block
+            party_match = _PARTY_ABBR_RE.search(node.text())
             if not party_match:
                 continue
-
             party_abbr = party_match.group(1).upper()
 
-            members.append({
-                "name": name,
-                "party": "Republican" if party_abbr == "R" else "Democratic",
-                "district": district,
-                "code": member_code,
-                "url": f"https://www.scstatehouse.gov/member.php?code={member_code}"
-            })
+            party = _PARTY[party_abbr]
+            members[str(district)] = Incumbent(
+                name=name,
+                party=party,
+                district=district,
+                code=member_code,
+                url=_URL_PREFIX + member_code,
+            )
+            counts[party] += 1
 
-        return members
+        return members, counts
 
-    def fetch_chamber_members(self, chamber: str) -> dict[str, dict]:
+    def fetch_chamber_members(self, chamber: str) -> dict[str, "Incumbent"]:
         """
         Fetch all members for a chamber.
 
@@ -383,7 +468,7 @@ class IncumbentsScraper:
             chamber: 'house' or 'senate'
 
         Returns:
-            Dict mapping district number (str) to member info
+            Dict mapping district number (str) to Incumbent
         """
         url = HOUSE_MEMBERS_URL if chamber == "house" else SENATE_MEMBERS_URL
 
@@ -391,65 +476,56 @@ class IncumbentsScraper:
 
         html = self.fetch_page_with_retry(url)
 
-        # Try primary parsing method
-        members = self.parse_members_page(html, chamber)
+        members, counts = self.parse_members(html, chamber)
+        self.party_counts[chamber] = counts
 
-        # If we didn't get enough members, try alternate method
         expected_min = 100 if chamber == "house" else 40
         if len(members) < expected_min:
-            logger.info(f"Primary parser found only {len(members)} members, trying alternate...")
-            alt_members = self.parse_members_alternate(html, chamber)
-            if len(alt_members) > len(members):
-                members = alt_members
+            logger.warning(f"Only parsed {len(members)} {chamber} members (expected >= {expected_min})")
 
         logger.info(f"Parsed {len(members)} {chamber} members")
 
-        # Build output structure indexed by district
-        result = {}
-        for member in members:
-            district = member.get("district")
-            if district:
-                result[str(district)] = {
-                    "name": member["name"],
-                    "party": member["party"],
-                    "url": member.get("url"),
-                    "photo_url": member.get("photo_url")
-                }
-
-        return result
+        return members
 
     def fetch_all(self) -> dict[str, Any]:
         """
         Fetch incumbent data for both chambers.
 
+        The two chamber pages are independent, so they download
+        concurrently and wall time is max(house, senate) instead of
+        their sum plus a courtesy delay.
+
         Returns:
             Complete incumbents data structure
         """
         output = {
-            "lastUpdated": datetime.now(timezone.utc).isoformat() + "Z",
+            "lastUpdated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "source": "SC State Legislature - scstatehouse.gov",
             "house": {},
             "senate": {}
         }
 
-        # Fetch House members
-        try:
-            output["house"] = self.fetch_chamber_members("house")
-            logger.info(f"House: {len(output['house'])} incumbents")
-        except Exception as e:
-            logger.error(f"Failed to fetch House members: {e}")
-            raise
-
-        # Small delay between requests to be respectful
-        time.sleep(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self.fetch_chamber_members, chamber): chamber
+                for chamber in ("house", "senate")
+            }
 
-        # Fetch Senate members
-        try:
-            output["senate"] = self.fetch_chamber_members("senate")
-            logger.info(f"Senate: {len(output['senate'])} incumbents")
-        except Exception as e:
-            logger.error(f"Failed to fetch Senate members: {e}")
-            raise
+            for future in as_completed(futures):
+                chamber = futures[future]
+                try:
+                    members = future.result()
+                    # Records only become dicts at the JSON boundary
+                    output[chamber] = {
+                        district: member.to_dict()
+                        for district, member in members.items()
+                    }
+                    logger.info(f"{chamber.capitalize()}: {len(output[chamber])} incumbents")
+                except Exception as e:
+                    logger.error(f"Failed to fetch {chamber.capitalize()} members: {e}")
+                    raise
+
+        self._save_cache()
 
         return output
 
@@ -463,15 +539,13 @@ class IncumbentsScraper:
             chamber_data = data.get(chamber, {})
             total = len(chamber_data)
 
-            dem_count = sum(
-                1 for m in chamber_data.values()
-                if m.get("party") == "Democratic"
-            )
-
-            rep_count = sum(
-                1 for m in chamber_data.values()
-                if m.get("party") == "Republican"
-            )
+            # Tallies were accumulated while parsing; recount only when
+            # summarizing data that did not come from this scraper run
+            counts = self.party_counts.get(chamber)
+            if counts is None:
+                counts = Counter(m.get("party") for m in chamber_data.values())
+            dem_count = counts["Democratic"]
+            rep_count = counts["Republican"]
 
             logger.info(f"\n{chamber.upper()}:")
             logger.info(f"  Total incumbents: {total}")
@@ -479,6 +553,20 @@ class IncumbentsScraper:
             logger.info(f"  Republicans: {rep_count}")
 
 
+def content_unchanged(path: Path, data: dict) -> bool:
+    """True when path already holds the same payload.
+
+    The volatile lastUpdated stamp is ignored; comparing raw bytes would
+    never match because the timestamp changes every run.
+    """
+    try:
+        existing = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    return {k: v for k, v in existing.items() if k != "lastUpdated"} == \
+        {k: v for k, v in data.items() if k != "lastUpdated"}
+
+
 def merge_with_existing_party_data(incumbents: dict, src_data_dir: Path) -> None:
     """
     Merge scraped incumbents with existing party-data.json.
@@ -493,20 +581,25 @@ def merge_with_existing_party_data(incumbents: dict, src_data_dir: Path) -> None
         return
 
     try:
-        with open(party_data_file) as f:
-            party_data = json.load(f)
+        raw = party_data_file.read_bytes()
+        party_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-        # Update incumbents section
-        if "incumbents" not in party_data:
-            party_data["incumbents"] = {}
+        # Skip the rewrite when the incumbents section already matches;
+        # a timestamp-only change would just churn git/CI downstream
+        existing = party_data.get("incumbents", {})
+        if (existing.get("house") == incumbents.get("house", {})
+                and existing.get("senate") == incumbents.get("senate", {})):
+            logger.info("party-data.json incumbents unchanged, skipping merge")
+            return
 
+        # Update incumbents section
+        party_data.setdefault("incumbents", {})
         party_data["incumbents"]["house"] = incumbents.get("house", {})
         party_data["incumbents"]["senate"] = incumbents.get("senate", {})
-        party_data["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
+        party_data["lastUpdated"] = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        # Write back
-        with open(party_data_file, "w") as f:
-            json.dump(party_data, f, indent=2)
+        # Write back atomically
+        write_bytes_atomic(party_data_file, dump_json_bytes(party_data))
 
         logger.info(f"Merged incumbents into: {party_data_file}")
 
@@ -525,23 +618,34 @@ def main() -> int:
         # Fetch all incumbent data
         data = scraper.fetch_all()
 
-        # Ensure output directory exists
+        # Ensure output directories exist
         OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to public/data/incumbents.json
-        with open(OUTPUT_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"\nOutput written to: {OUTPUT_FILE}")
-
-        # Also write to src/data/incumbents.json
         SRC_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
         src_output = SRC_DATA_DIR / "incumbents.json"
-        with open(src_output, "w") as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"Also written to: {src_output}")
 
-        # Optionally merge with party-data.json
-        merge_with_existing_party_data(data, SRC_DATA_DIR)
+        if content_unchanged(OUTPUT_FILE, data) and src_output.exists():
+            logger.info("\nIncumbent data unchanged, skipping writes")
+
+            # The merge still runs; it skips internally when current
+            merge_with_existing_party_data(data, SRC_DATA_DIR)
+        else:
+            # Serialize once, then run the two atomic writes and the
+            # party-data merge in parallel - they are independent, so
+            # their fsync latencies overlap instead of adding up
+            payload = dump_json_bytes(data)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(write_bytes_atomic, OUTPUT_FILE, payload),
+                    executor.submit(write_bytes_atomic, src_output, payload),
+                    executor.submit(merge_with_existing_party_data, data, SRC_DATA_DIR),
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+            logger.info(f"\nOutput written to: {OUTPUT_FILE}")
+            logger.info(f"Also written to: {src_output}")
 
         # Print summary
         scraper.generate_summary(data)